@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Any, Optional, Union, List, Tuple, Dict
 
 from . import util
@@ -71,18 +72,19 @@ class Context:
         return self
 
     def values(self, value: Any) -> Context:
-        converter = self.state.get('converter')
+        state = self.state
+        converter = state.get('converter')
         if value is not None and converter:
             if isinstance(value, self._MULTI_TYPES):
                 value = tuple(map(converter, value))
             else:
                 value = converter(value)
 
-        if self.state.get('params'):
-            self.literal('%s')
+        if state.get('params'):
+            self._sql.append('%s')
 
         if isinstance(value, self._MULTI_TYPES):
-            if not self.state.get('nesting'):
+            if not state.get('nesting'):
                 self._values.extend(value)
                 return self
         self._values.append(value)
@@ -96,19 +98,21 @@ class Context:
 
 class Query:
 
-    __slots__ = ('_sql', '_params', '_fread')
+    __slots__ = ('sql', 'params', '_fread')
 
-    _QKS = ("SELECT", "SHOW")
+    _QKS_REGEX = re.compile(r'SELECT|SHOW', re.I)
 
     @util.argschecker(sql=str)
     def __init__(
         self,
         sql: str,
-        params: Optional[list] = None,
+        params: Optional[Union[List[Any], Tuple[Any, ...]]] = None,
         fread: Optional[bool] = None,
     ) -> None:
-        self._sql = sql
-        self._params = params or []
+        if params is not None and not isinstance(params, (tuple, list)):
+            raise TypeError("invalid query params")
+        self.sql = sql.strip()
+        self.params = tuple(params or ())
         self._fread = fread
 
     def __repr__(self) -> str:
@@ -118,7 +122,14 @@ class Query:
         return f"{self.sql} % {self.params}"
 
     def __bool__(self) -> bool:
-        return bool(self._sql)
+        return bool(self.sql)
+
+    def _copy(self) -> Query:
+        copied = Query.__new__(Query)
+        copied.sql = self.sql
+        copied.params = self.params
+        copied._fread = self._fread  # pylint: disable=protected-access
+        return copied
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Query):
@@ -127,25 +138,12 @@ class Query:
             )
         return self.sql == other.sql and self.params == other.params
 
-    @property
-    def sql(self) -> str:
-        return self._sql.strip()
-
-    @property
-    def params(self) -> Tuple[Any, ...]:
-        if not isinstance(self._params, (tuple, list)):
-            raise TypeError("invalid query params")
-        return tuple(self._params)
-
     @property
     def r(self) -> bool:
         if self._fread is not None:
             return self._fread
 
-        for k in self._QKS:
-            if k in self.sql.upper():
-                return True
-        return False
+        return self._QKS_REGEX.search(self.sql) is not None
 
     @r.setter
     def r(self, isr: Optional[bool]) -> None:
@@ -173,26 +171,32 @@ class NodeList(Node):
         self.glue = glue
         self.parens = parens
         if parens and len(self.nodes) == 1:
-            if hasattr(self.nodes[0], 'parens'):
-                self.nodes[0].parens = False  # type: ignore
+            node = self.nodes[0]
+            if hasattr(node, 'parens'):
+                node.parens = False  # type: ignore
+                try:
+                    # The rewrite changes how the node serializes, so
+                    # any query cached before it joined this list is
+                    # stale and must go.
+                    node.__dict__.pop('_query_cache', None)
+                except AttributeError:
+                    pass
 
     def __sql__(self, ctx: Context) -> Context:
-        nlen = len(self.nodes)
-        if nlen == 0:
+        nodes = self.nodes
+        if not nodes:
             return ctx.literal('()') if self.parens else ctx
 
-        def paser(ctx, node):
-            if isinstance(node, Node):
-                ctx.sql(node)
-            else:
-                ctx.literal(node)  # type: ignore
-
+        glue = self.glue
+        last = len(nodes) - 1
         with ctx(parens=self.parens):
-            for i in range(nlen - 1):
-                paser(ctx, self.nodes[i])
-                ctx.literal(self.glue)
-
-            paser(ctx, self.nodes[-1])
+            for i, node in enumerate(nodes):
+                if isinstance(node, Node):
+                    ctx.sql(node)
+                else:
+                    ctx.literal(node)  # type: ignore
+                if i != last:
+                    ctx.literal(glue)
 
         return ctx
 
@@ -259,4 +263,33 @@ class Value(Node):
 
 
 def parse(node: Node) -> Query:
-    return Context().parse(node).query_of()
+    # pylint: disable=protected-access
+    # Subclasses of SQL may serialize differently, hence the exact
+    # type check.
+    if type(node) is SQL and not node.params:  # pylint: disable=unidiomatic-typecheck
+        # A bare SQL literal needs no context walk at all.
+        sql = node.sql
+        if sql != Context._SEMI:
+            sql += Context._SEMI
+        return Query(sql)
+
+    try:
+        # Probe the instance dict directly: a getattr here would run
+        # permissive __getattr__ hooks such as Func's factory lookup
+        # and mistake their result for a cached query.
+        cached = node.__dict__.get('_query_cache')
+    except AttributeError:
+        cached = None
+    if cached is not None:
+        return cached._copy()
+
+    query = Context().parse(node).query_of()
+    try:
+        # Expression trees are immutable once built, so the serialized
+        # query can be reused for every later parse of the same node.
+        node._query_cache = query  # type: ignore
+    except AttributeError:
+        return query
+    # Queries are mutable (the r flag has a setter), so callers get a
+    # copy and the cached instance stays pristine.
+    return query._copy()
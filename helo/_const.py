@@ -1,37 +1,26 @@
+import sys
+from collections import namedtuple
+
 from . import util
 
-OPERATOR = util.adict(
-    AND='AND',
-    OR='OR',
-    ADD='+',
-    SUB='-',
-    MUL='*',
-    DIV='/',
-    BIN_AND='&',
-    BIN_OR='|',
-    XOR='#',
-    MOD='%',
-    EQ='=',
-    LT='<',
-    LTE='<=',
-    GT='>',
-    GTE='>=',
-    NE='!=',
-    IN='IN',
-    NOT_IN='NOT IN',
-    IS='IS',
-    IS_NOT='IS NOT',
-    LIKE='LIKE BINARY',
-    ILIKE='LIKE',
-    EXISTS='EXISTS',
-    NEXISTS='NOT EXISTS',
-    BETWEEN='BETWEEN',
-    NBETWEEN='NOT BETWEEN',
-    REGEXP='REGEXP BINARY',
-    IREGEXP='REGEXP',
-    BITWISE_NEGATION='~',
-    CONCAT='||',
-)
+_Operator = namedtuple('_Operator', (
+    'AND', 'OR', 'ADD', 'SUB', 'MUL', 'DIV', 'BIN_AND', 'BIN_OR',
+    'XOR', 'MOD', 'EQ', 'LT', 'LTE', 'GT', 'GTE', 'NE', 'IN',
+    'NOT_IN', 'IS', 'IS_NOT', 'LIKE', 'ILIKE', 'EXISTS', 'NEXISTS',
+    'BETWEEN', 'NBETWEEN', 'REGEXP', 'IREGEXP', 'BITWISE_NEGATION',
+    'CONCAT',
+))
+# A namedtuple makes OPERATOR.X a C-level item load instead of a dict
+# lookup, and the fragments are compared and hashed constantly while
+# building SQL, so interning them turns those comparisons into pointer
+# checks.
+OPERATOR = _Operator(*(sys.intern(op) for op in (
+    'AND', 'OR', '+', '-', '*', '/', '&', '|',
+    '#', '%', '=', '<', '<=', '>', '>=', '!=', 'IN',
+    'NOT IN', 'IS', 'IS NOT', 'LIKE BINARY', 'LIKE', 'EXISTS',
+    'NOT EXISTS', 'BETWEEN', 'NOT BETWEEN', 'REGEXP BINARY',
+    'REGEXP', '~', '||',
+)))
 MYSQL_ENGINE = util.adict(
     innodb="InnoDB",
     myisam="MyISAM",
@@ -813,7 +813,7 @@ class ValuesMatch(_builder.Node):
             self._values = tuple(rows.values())
         elif isinstance(rows, list):
             columns = list(rows[0].keys())
-            self._values = tuple([tuple(r.values()) for r in rows])
+            self._values = tuple(tuple(r.values()) for r in rows)
         else:
             raise ValueError("invalid data unpack to values")
 
@@ -870,8 +870,6 @@ class AssignmentList(_builder.Node):
 
     __slots__ = ('_data_dict',)
 
-    _VSM = "`{col}` = {val}"
-
     def __init__(self, data: Dict[str, Any]) -> None:
         self._data_dict = data
 
@@ -880,26 +878,17 @@ class AssignmentList(_builder.Node):
         for col, value in self._data_dict.items():
             if isinstance(value, types.FieldBase):
                 values.append(_builder.SQL(
-                    self._VSM.format(
-                        col=col,
-                        val="{}.{}".format(
-                            value.table.table_name,
-                            value.column)
-                    )
+                    '`' + col + '` = '
+                    + value.table.table_name + '.' + value.column
                 ))
             elif isinstance(value, types.Expression):
                 query = _builder.parse(value)
                 values.append(_builder.SQL(
-                    self._VSM.format(
-                        col=col,
-                        val=query.sql[0:-1]
-                    )
+                    '`' + col + '` = ' + query.sql[0:-1]
                 ))
                 params.append(query.params)
             else:
-                values.append(_builder.SQL(
-                    self._VSM.format(col=col, val='%s')
-                ))
+                values.append(_builder.SQL('`' + col + '` = %s'))
                 params.append(value)
 
         ctx.sql(
@@ -1419,7 +1408,7 @@ class Drop(Create):
 class Loader:
 
     __slots__ = ('_data', '_modelclass', '_wrap',
-                 '_mattrs', '_mfields', '_aliases')
+                 '_mattrs', '_mnames', '_mfields', '_aliases')
 
     def __init__(
         self,
@@ -1434,6 +1423,7 @@ class Loader:
         self._wrap = wrap
 
         self._mattrs = get_attrs(self._modelclass)
+        self._mnames = frozenset(self._mattrs.values())
         self._mfields = get_table(self._modelclass).fields_dict
 
     def do(self) -> Any:
@@ -1460,7 +1450,7 @@ class Loader:
     ) -> util.adict:
         if isinstance(row, dict):
             for name in row.copy():
-                if name not in self._mattrs.values():
+                if name not in self._mnames:
                     aname = self._aliases.get(name, name)
                     rname = self._mattrs.get(aname, aname)
                     row[rname] = row.pop(name)
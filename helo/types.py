@@ -7,8 +7,8 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import sys
 import uuid
-import warnings
 from typing import Any, Optional, Union, Callable, List, Tuple, Dict
 
 from . import util, err, _helper, _builder, _const
@@ -53,6 +53,42 @@ ON_UPDATE = SQL('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP')
 ENCODING = util.In(_const.ENCODINGS, 'Encoding')
 ENGINE = _const.MYSQL_ENGINE
 OPERATOR = _const.OPERATOR
+_OP_SQL = {op: f" {op} " for op in OPERATOR}
+
+# Module-level bindings of the operator constants. The expression
+# methods run once per operator use, and a plain global load is far
+# cheaper than an adict __getattr__ round trip each time.
+_AND = OPERATOR.AND
+_OR = OPERATOR.OR
+_ADD = OPERATOR.ADD
+_SUB = OPERATOR.SUB
+_MUL = OPERATOR.MUL
+_DIV = OPERATOR.DIV
+_BIN_AND = OPERATOR.BIN_AND
+_BIN_OR = OPERATOR.BIN_OR
+_XOR = OPERATOR.XOR
+_EQ = OPERATOR.EQ
+_NE = OPERATOR.NE
+_LT = OPERATOR.LT
+_LTE = OPERATOR.LTE
+_GT = OPERATOR.GT
+_GTE = OPERATOR.GTE
+_IN = OPERATOR.IN
+_NOT_IN = OPERATOR.NOT_IN
+_IS = OPERATOR.IS
+_IS_NOT = OPERATOR.IS_NOT
+_LIKE = OPERATOR.LIKE
+_ILIKE = OPERATOR.ILIKE
+_EXISTS = OPERATOR.EXISTS
+_NEXISTS = OPERATOR.NEXISTS
+_BETWEEN = OPERATOR.BETWEEN
+_NBETWEEN = OPERATOR.NBETWEEN
+_REGEXP = OPERATOR.REGEXP
+_IREGEXP = OPERATOR.IREGEXP
+_CONCAT = OPERATOR.CONCAT
+
+# Operators whose right-hand side is rendered as a nested value list.
+_IN_OPS = frozenset((_IN, _NOT_IN, _EXISTS, _NEXISTS))
 
 
 class _ColumnBase(_builder.Node):
@@ -63,81 +99,89 @@ class _ColumnBase(_builder.Node):
         raise NotImplementedError
 
     def __and__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.AND, rhs)
+        if rhs is True:
+            return self  # type: ignore
+        return Expression(self, _AND, rhs)
 
     def __rand__(self, lhs: Any) -> Expression:
-        return Expression(lhs, OPERATOR.AND, self)
+        if lhs is True:
+            return self  # type: ignore
+        return Expression(lhs, _AND, self)
 
     def __or__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.OR, rhs)
+        if rhs is False:
+            return self  # type: ignore
+        return Expression(self, _OR, rhs)
 
     def __ror__(self, lhs: Any) -> Expression:
-        return Expression(lhs, OPERATOR.OR, self)
+        if lhs is False:
+            return self  # type: ignore
+        return Expression(lhs, _OR, self)
 
     def __add__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.ADD, rhs)
+        return Expression(self, _ADD, rhs)
 
     def __radd__(self, lhs: Any) -> Expression:
-        return Expression(lhs, OPERATOR.ADD, self)
+        return Expression(lhs, _ADD, self)
 
     def __sub__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.SUB, rhs)
+        return Expression(self, _SUB, rhs)
 
     def __rsub__(self, lhs: Any) -> Expression:
-        return Expression(lhs, OPERATOR.SUB, self)
+        return Expression(lhs, _SUB, self)
 
     def __mul__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.MUL, rhs)
+        return Expression(self, _MUL, rhs)
 
     def __rmul__(self, lhs: Any) -> Expression:
-        return Expression(lhs, OPERATOR.MUL, self)
+        return Expression(lhs, _MUL, self)
 
     def __div__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.DIV, rhs)
+        return Expression(self, _DIV, rhs)
 
     def __rdiv__(self, lhs: Any) -> Expression:
-        return Expression(lhs, OPERATOR.DIV, self)
+        return Expression(lhs, _DIV, self)
 
     __truediv__ = __div__
     __rtruediv__ = __rdiv__
 
     def __xor__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.XOR, rhs)
+        return Expression(self, _XOR, rhs)
 
     def __rxor__(self, lhs: Any) -> Expression:
-        return Expression(lhs, OPERATOR.XOR, self)
+        return Expression(lhs, _XOR, self)
 
     def __eq__(self, rhs: Any) -> Expression:  # type: ignore
-        op = OPERATOR.IS if rhs is None else OPERATOR.EQ
+        op = _IS if rhs is None else _EQ
         return Expression(self, op, rhs)
 
     def __ne__(self, rhs: Any) -> Expression:  # type: ignore
-        op = OPERATOR.IS_NOT if rhs is None else OPERATOR.NE
+        op = _IS_NOT if rhs is None else _NE
         return Expression(self, op, rhs)
 
     def __lt__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.LT, rhs)
+        return Expression(self, _LT, rhs)
 
     def __le__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.LTE, rhs)
+        return Expression(self, _LTE, rhs)
 
     def __gt__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.GT, rhs)
+        return Expression(self, _GT, rhs)
 
     def __ge__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.GTE, rhs)
+        return Expression(self, _GTE, rhs)
 
     def __lshift__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.IN, rhs)
+        return Expression(self, _IN, rhs)
 
     def __rshift__(self, rhs: Any):
-        return Expression(self, OPERATOR.IS, rhs)
+        return Expression(self, _IS, rhs)
 
     def __mod__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.LIKE, rhs)
+        return Expression(self, _LIKE, rhs)
 
     def __pow__(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.ILIKE, rhs)
+        return Expression(self, _ILIKE, rhs)
 
     def __getitem__(self, item: slice) -> Expression:
         if isinstance(item, slice):
@@ -149,68 +193,68 @@ class _ColumnBase(_builder.Node):
         return self == item
 
     def concat(self, rhs: Any) -> StrExpression:
-        return StrExpression(self, OPERATOR.CONCAT, rhs)
+        return StrExpression(self, _CONCAT, rhs)
 
     def binand(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.BIN_AND, rhs)
+        return Expression(self, _BIN_AND, rhs)
 
     def binor(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.BIN_OR, rhs)
+        return Expression(self, _BIN_OR, rhs)
 
     def in_(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.IN, rhs)
+        return Expression(self, _IN, rhs)
 
     def nin_(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.NOT_IN, rhs)
+        return Expression(self, _NOT_IN, rhs)
 
     def exists(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.EXISTS, rhs)
+        return Expression(self, _EXISTS, rhs)
 
     def nexists(self, rhs: Any) -> Expression:
-        return Expression(self, OPERATOR.NEXISTS, rhs)
+        return Expression(self, _NEXISTS, rhs)
 
     def isnull(self, is_null: bool = True) -> Expression:
-        op = OPERATOR.IS if is_null else OPERATOR.IS_NOT
+        op = _IS if is_null else _IS_NOT
         return Expression(self, op, None)
 
     def regexp(self, rhs: Any, i: bool = True) -> Expression:
         if i:
-            return Expression(self, OPERATOR.IREGEXP, rhs)
-        return Expression(self, OPERATOR.REGEXP, rhs)
+            return Expression(self, _IREGEXP, rhs)
+        return Expression(self, _REGEXP, rhs)
 
     def like(self, rhs: Any, i: bool = True) -> Expression:
         if i:
-            return Expression(self, OPERATOR.ILIKE, rhs)
-        return Expression(self, OPERATOR.LIKE, rhs)
+            return Expression(self, _ILIKE, rhs)
+        return Expression(self, _LIKE, rhs)
 
     def contains(self, rhs: Any, i: bool = True) -> Expression:
         if i:
-            return Expression(self, OPERATOR.ILIKE, f"%{rhs}%")
-        return Expression(self, OPERATOR.LIKE, f"%{rhs}%")
+            return Expression(self, _ILIKE, f"%{rhs}%")
+        return Expression(self, _LIKE, f"%{rhs}%")
 
     def startswith(self, rhs: Any, i: bool = True) -> Expression:
         if i:
-            return Expression(self, OPERATOR.ILIKE, f"{rhs}%")
-        return Expression(self, OPERATOR.LIKE, f"{rhs}%")
+            return Expression(self, _ILIKE, f"{rhs}%")
+        return Expression(self, _LIKE, f"{rhs}%")
 
     def endswith(self, rhs: Any, i: bool = True) -> Expression:
         if i:
-            return Expression(self, OPERATOR.ILIKE, f"%{rhs}")
-        return Expression(self, OPERATOR.LIKE, f"%{rhs}")
+            return Expression(self, _ILIKE, f"%{rhs}")
+        return Expression(self, _LIKE, f"%{rhs}")
 
     def between(self, low: Any, hig: Any) -> Expression:
         return Expression(
-            self, OPERATOR.BETWEEN,
+            self, _BETWEEN,
             _builder.NodeList(
-                [_builder.Value(low), OPERATOR.AND, _builder.Value(hig)]
+                [_builder.Value(low), _AND, _builder.Value(hig)]
             )
         )
 
     def nbetween(self, low: Any, hig: Any) -> Expression:
         return Expression(
-            self, OPERATOR.NBETWEEN,
+            self, _NBETWEEN,
             _builder.NodeList(
-                [_builder.Value(low), OPERATOR.AND, _builder.Value(hig)]
+                [_builder.Value(low), _AND, _builder.Value(hig)]
             )
         )
 
@@ -266,7 +310,7 @@ class _Alias(Column):
 
 class Expression(Column):
 
-    __slots__ = ('lhs', 'op', 'rhs', 'parens')
+    __slots__ = ('lhs', 'op', 'rhs', 'parens', '_op_sql', '_converter')
 
     def __init__(
         self, lhs: Any, op: str, rhs: Any, parens: bool = True
@@ -275,34 +319,65 @@ class Expression(Column):
         self.op = op
         self.rhs = rhs
         self.parens = parens
+        self._op_sql = _OP_SQL.get(op) or f' {op} '
+        # Resolve the converter on the class so instance __getattr__
+        # hooks (such as Func's factory lookup) cannot answer for
+        # operand types that have no db_value at all.
+        conv = getattr(type(lhs), 'db_value', None)
+        if conv is not None:
+            self._converter = conv.__get__(lhs)
+        else:
+            conv = getattr(type(rhs), 'db_value', None)
+            self._converter = conv.__get__(rhs) if conv is not None else None
+
+    def __and__(self, rhs: Any) -> Expression:
+        if rhs is True:
+            return self
+        if self.op == _AND:
+            # Chained conjunctions are associative; rendering the lhs
+            # without its own parens flattens ((a AND b) AND c) into
+            # (a AND b AND c).
+            return Expression(
+                Expression(self.lhs, self.op, self.rhs, parens=False),
+                _AND, rhs
+            )
+        return Expression(self, _AND, rhs)
+
+    def __or__(self, rhs: Any) -> Expression:
+        if rhs is False:
+            return self
+        if self.op == _OR:
+            return Expression(
+                Expression(self.lhs, self.op, self.rhs, parens=False),
+                _OR, rhs
+            )
+        return Expression(self, _OR, rhs)
 
     def __sql__(self, ctx: _builder.Context) -> _builder.Context:
-        overrides = {'parens': self.parens, 'params': True}
-
-        if isinstance(self.lhs, FieldBase):
-            overrides['converter'] = self.lhs.db_value
-        elif isinstance(self.rhs, FieldBase):
-            overrides['converter'] = self.rhs.db_value
-
-        if self.op in (OPERATOR.IN,
-                       OPERATOR.NOT_IN,
-                       OPERATOR.EXISTS,
-                       OPERATOR.NEXISTS):
-            if not isinstance(self.rhs, (SEQUENCE, _builder.Node)):
-                raise TypeError(
-                    f"invalid values {self.rhs} for operator '{self.op}'")
-            if isinstance(self.rhs, _builder.Node):
-                self.rhs = _builder.EnclosedNodeList([self.rhs])
+        overrides = {
+            'parens': self.parens,
+            'params': True,
+            'converter': self._converter,
+        }
+
+        rhs = self.rhs
+        if self.op in _IN_OPS:
+            if isinstance(rhs, _builder.Node):
+                rhs = _builder.EnclosedNodeList([rhs])
+            elif isinstance(rhs, SEQUENCE):
+                if not isinstance(rhs, tuple):
+                    rhs = tuple(rhs)
             else:
-                self.rhs = tuple(self.rhs)
+                raise TypeError(
+                    f"invalid values {rhs} for operator '{self.op}'")
             overrides['nesting'] = True
 
         with ctx(**overrides):
             ctx.sql(
                 self.lhs
             ).literal(
-                f' {self.op} '
-            ).sql(self.rhs)
+                self._op_sql
+            ).sql(rhs)
 
         return ctx
 
@@ -315,106 +390,83 @@ class StrExpression(Expression):
         return self.concat(rhs)
 
     def __radd__(self, lhs: Any) -> StrExpression:
-        return StrExpression(lhs, OPERATOR.CONCAT, self)
+        return StrExpression(lhs, _CONCAT, self)
 
 
 class _FieldDef:
 
     __slots__ = ('field',)
-    __types__ = util.adict(
-        sit='{type}',
-        wlt='{type}({length})',
-        wdt='{type}({length},{float_length})',
-    )
 
     def __init__(self, field: FieldBase) -> None:
         self.field = field
 
-    def parse(self) -> _builder.NodeList:
-        defi = _builder.NodeList(
-            [SQL(self.field.column), self._parse_type(self.field)]
-        )
-
-        ops = self._parse_options()
-        if ops.unsigned:
-            defi.append(SQL("unsigned"))
-        if ops.encoding:
-            defi.append(SQL(f"CHARACTER SET {ops.encoding}"))
-        if ops.zerofill:
-            defi.append(SQL("zerofill"))
-        default = self._parse_default(ops, self.field.db_type)
+    def parse(self) -> SQL:
+        field = self.field
+        defi = [field.column, self._parse_type(field)]
+
+        if field.unsigned:
+            defi.append("unsigned")
+        if field.encoding:
+            defi.append(f"CHARACTER SET {field.encoding}")
+        if field.zerofill:
+            defi.append("zerofill")
+        default = self._parse_default(field)
         if default:
             defi.append(default)
-        if ops.comment:
-            defi.append(SQL(f"COMMENT '{ops.comment}'"))
-        return defi
-
-    def _parse_type(self, field: FieldBase) -> SQL:
-        type_render = {'type': field.db_type}
+        if field.comment:
+            defi.append(f"COMMENT '{field.comment}'")
+        return SQL(' '.join(defi))
 
-        type_tpl = self.__types__.sit
-        length = getattr(field, 'length', None)
+    def _parse_type(self, field: FieldBase) -> str:
+        db_type = field.db_type
+        length = field.length
 
-        if length:
-            type_render['length'] = length
-            type_tpl = self.__types__.wlt
         if isinstance(length, tuple) and len(length) == 2:
-            type_render['length'] = length[0]
-            float_length = length[1]
-            if float_length:
-                type_render['float_length'] = float_length
-                type_tpl = self.__types__.wdt
-
-        return SQL(type_tpl.format(**type_render))
-
-    def _parse_options(self) -> util.adict:
-        return util.adict(
-            auto=getattr(self.field, 'auto', None),
-            unsigned=getattr(self.field, 'unsigned', None),
-            zerofill=getattr(self.field, 'zerofill', None),
-            encoding=getattr(self.field, 'encoding', None),
-            default=getattr(self.field, 'default', NULL),
-            allow_null=self.field.null,
-            comment=self.field.comment,
-            adapt=self.field.to_str,
-        )
+            if length[1]:
+                return f"{db_type}({length[0]},{length[1]})"
+            return f"{db_type}({length[0]})"
+        if length:
+            return f"{db_type}({length})"
+        return db_type
 
-    def _parse_default(self, ops: util.adict, db_type) -> Optional[SQL]:
+    def _parse_default(self, field: FieldBase) -> Optional[str]:
 
         def to_default_sql(default):
             if isinstance(default, SQL):
                 return "DEFAULT {}".format(default.sql)
             if callable(default):
                 return None
-            return "DEFAULT '{}'".format(ops.adapt(default))
+            return "DEFAULT '{}'".format(field.to_str(default))
 
-        if ops.auto:
-            return SQL("NOT NULL AUTO_INCREMENT")
+        if field.auto:
+            return "NOT NULL AUTO_INCREMENT"
 
-        if ops.allow_null:
-            if ops.default is None:
+        db_type = field.db_type
+        fdefault = getattr(field, 'default', NULL)
+        if field.null:
+            if fdefault is None:
                 default = "DEFAULT NULL"
                 if db_type == 'timestamp':
                     default = "NULL {}".format(default)
-            elif ops.default == NULL:
+            elif fdefault == NULL:
                 default = "NULL"
             else:
-                default = to_default_sql(ops.default)
+                default = to_default_sql(fdefault)
                 if default is None:
                     if db_type == 'timestamp':
                         default = "NULL DEFAULT NULL"
                     else:
                         default = "DEFAULT NULL"
         else:
-            if ops.default in (None, NULL):
+            if fdefault in (None, NULL):
                 default = "NOT NULL"
             else:
                 default = "NOT NULL"
-                ds = to_default_sql(ops.default)
+                ds = to_default_sql(fdefault)
                 if ds:
                     default = '{} {}'.format(default, ds)
 
-        return SQL(default) if default is not None else None
+        return default
 
 
 class FieldBase(Column):
@@ -423,10 +475,23 @@ class FieldBase(Column):
 
     py_type = None  # type: Any
     db_type = None  # type: Any
+    _qname = None   # type: Optional[Tuple[str, str]]
+
+    # DDL attributes that only some subclasses carry; the class-level
+    # fallbacks let _FieldDef read them directly instead of reflecting
+    # with getattr on every definition render.
+    length = None    # type: Any
+    unsigned = False
+    zerofill = False
+    encoding = None  # type: Optional[str]
+    auto = False
+
+    # Subclasses that never want the NOT NULL/no-default warning turn
+    # this off instead of overriding _custom_wain.
+    _wain = True
 
     VALUEERR_MSG = "Invalid value({}) for {} Field!"
 
-    @util.argschecker(null=bool, comment=str)
     def __init__(
         self,
         null: bool,
@@ -434,6 +499,17 @@ class FieldBase(Column):
         comment: str,
         name: str = ''
     ) -> None:
+        # Fields are constructed for every model class; two identity
+        # compares and one isinstance are much cheaper than the
+        # signature-binding argschecker wrapper here.
+        if null is not True and null is not False:
+            raise TypeError(
+                f"argument null must be {bool}, now got {type(null)}"
+            )
+        if not isinstance(comment, str):
+            raise TypeError(
+                f"argument comment must be {str}, now got {type(comment)}"
+            )
 
         if default:
             if isinstance(self.py_type, (list, tuple)):
@@ -454,8 +530,14 @@ class FieldBase(Column):
 
         self._custom_wain()
 
-    def __def__(self) -> _builder.NodeList:
-        return _FieldDef(self).parse()
+    def __def__(self) -> SQL:
+        # The definition never changes once the field is bound to its
+        # table, so render it once and hand back the same node after.
+        defi = getattr(self, '_defi', None)
+        if defi is None:
+            defi = _FieldDef(self).parse()
+            self._defi = defi
+        return defi
 
     def __repr__(self) -> str:
         return f"<types.{self.__class__.__name__} object '{self.name}'>"
@@ -469,8 +551,11 @@ class FieldBase(Column):
         raise err.NoColumnNameError
 
     def _custom_wain(self) -> None:
+        if not self._wain:
+            return
         if not self.null and self.default is None:
             if not getattr(self, 'primary_key', False):
+                import warnings  # pylint: disable=import-outside-toplevel
                 warnings.warn(
                     'Not to give default value for '
                     f'NOT NULL field {self.__class__.__name__}'
@@ -478,9 +563,13 @@ class FieldBase(Column):
 
     @property
     def column(self) -> str:
-        if self.name:
-            return f"`{self.name}`"
-        raise err.NoColumnNameError
+        if not self.name:
+            raise err.NoColumnNameError
+        qname = self._qname
+        if qname is None or qname[0] != self.name:
+            qname = (self.name, sys.intern(f"`{self.name}`"))
+            self._qname = qname
+        return qname[1]
 
     def adapt(self, value: Any) -> Any:
         try:
@@ -508,7 +597,7 @@ class FieldBase(Column):
                 tn = ctx.table_alias(self.table.name)
             else:
                 tn = self.table.table_name
-            ctx.literal("{}.{}".format(tn, self.column))
+            ctx.literal(tn + '.' + self.column)
         else:
             ctx.literal(self.column)
         return ctx
@@ -701,7 +790,7 @@ class Double(Float):
 
 class Decimal(FieldBase):
 
-    __slots__ = ('length', 'unsigned', 'auto_round', 'rounding')
+    __slots__ = ('length', 'unsigned', 'auto_round', 'rounding', '_exp')
 
     py_type = decimal.Decimal
     db_type = 'decimal'
@@ -726,6 +815,7 @@ class Decimal(FieldBase):
         self.unsigned = unsigned
         self.auto_round = auto_round
         self.rounding = rounding or decimal.DefaultContext.rounding
+        self._exp = self.py_type(10) ** (-self.length[1]) if auto_round else None
         super().__init__(
             null=null,
             default=default,
@@ -737,9 +827,8 @@ class Decimal(FieldBase):
         if not value:
             return value if value is None else self.py_type(0)
         if self.auto_round:
-            exp = self.py_type(10) ** (-self.length[1])  # type: ignore
-            rounding = self.rounding
-            return self.py_type(str(value)).quantize(exp, rounding=rounding)
+            return self.py_type(str(value)).quantize(
+                self._exp, rounding=self.rounding)
         return self.py_type(str(value))
 
     def py_value(self, value: Any) -> Optional[decimal.Decimal]:
@@ -773,10 +862,10 @@ class Text(FieldBase):
         self.table = None
 
     def __add__(self, other: Any) -> StrExpression:
-        return StrExpression(self, OPERATOR.CONCAT, other)
+        return StrExpression(self, _CONCAT, other)
 
     def __radd__(self, other: Any) -> StrExpression:
-        return StrExpression(other, OPERATOR.CONCAT, self)
+        return StrExpression(other, _CONCAT, self)
 
 
 class Char(FieldBase):
@@ -805,10 +894,10 @@ class Char(FieldBase):
         )
 
     def __add__(self, other: Any) -> StrExpression:
-        return StrExpression(self, OPERATOR.CONCAT, other)
+        return StrExpression(self, _CONCAT, other)
 
     def __radd__(self, other: Any) -> StrExpression:
-        return StrExpression(other, OPERATOR.CONCAT, self)
+        return StrExpression(other, _CONCAT, self)
 
 
 class VarChar(Char):
@@ -824,6 +913,7 @@ class UUID(FieldBase):
 
     py_type = uuid.UUID
     db_type = "varchar(40)"
+    _wain = False
 
     def __init__(
             self,
@@ -857,9 +947,6 @@ class UUID(FieldBase):
             return value
         return self.py_type(value) if value is not None else None
 
-    def _custom_wain(self):
-        pass
-
 
 class IP(Bigint):
     """IPV4"""
@@ -1021,6 +1108,7 @@ class Timestamp(FieldBase):
 
     py_type = datetime.datetime
     db_type = 'timestamp'
+    _wain = False
 
     FORMATS = (
         '%Y-%m-%d %H:%M:%S',
@@ -1040,9 +1128,6 @@ class Timestamp(FieldBase):
             null=null, default=default, comment=comment, name=name
         )
 
-    def _custom_wain(self) -> None:
-        pass
-
     def db_value(
         self, value: Union[datetime.datetime, int, str]
     ) -> Optional[datetime.datetime]:
@@ -1079,6 +1164,7 @@ class Timestamp(FieldBase):
 class Func(_builder.Node):
 
     __slots__ = ('_func', '_node')
+    _factories = {}  # type: Dict[str, Callable]
 
     def __init__(self, func: str, node: _ColumnBase) -> None:
         self._func = func.upper()
@@ -1086,11 +1172,19 @@ class Func(_builder.Node):
 
     @util.argschecker(func=str, nullable=False)
     def __getattr__(self, func: str) -> Any:
+        if func.startswith('_'):
+            # Underscore probes (cache lookups, copy/pickle protocol
+            # checks) are not SQL functions and must not land in the
+            # shared factory table.
+            raise AttributeError(func)
+        factory = self._factories.get(func)
+        if factory is None:
 
-        def decorator(*args, **kwargs):
-            return Func(func, *args, **kwargs)
+            def factory(*args, **kwargs):
+                return Func(func, *args, **kwargs)
 
-        return decorator
+            self._factories[func] = factory
+        return factory
 
     def as_(self, alias: str) -> str:
         return _Alias(self, alias)
@@ -1107,9 +1201,10 @@ F = Func("", None)  # type: ignore
 
 class IndexBase(_builder.Node):
 
-    __slots__ = ('fields', 'comment', 'name')
+    __slots__ = ('fields', 'comment', 'name', '_fields_sql', '_defi')
     __type__ = None  # type: SQL
 
+    @util.argschecker(name=str, nullable=False)
     def __init__(
             self,
             name: str,
@@ -1125,24 +1220,27 @@ class IndexBase(_builder.Node):
         if not isinstance(fields, SEQUENCE):
             fields = [fields]  # type: ignore
 
-        self.fields = []       # type: List[str]
+        quoted = []            # type: List[str]
         for f in fields:       # type: ignore
             if isinstance(f, str):
-                self.fields.append(f"`{f}`")
+                quoted.append(f"`{f}`")
             elif isinstance(f, FieldBase):
-                self.fields.append(f.column)
+                quoted.append(f.column)
             else:
                 raise TypeError(f"invalid field type: {f}")
+        self.fields = tuple(quoted)  # type: Tuple[str, ...]
+        self._fields_sql = SQL("({})".format(", ".join(quoted)))
 
-    def __def__(self) -> _builder.NodeList:
-        nl = _builder.NodeList([
+        self._defi = _builder.NodeList([
             self.__type__,
             self,
-            _builder.EnclosedNodeList(self.fields),  # type: ignore
+            self._fields_sql,
         ])
         if self.comment:
-            nl.append(SQL(f"COMMENT '{self.comment}'"))
-        return nl
+            self._defi.append(SQL(f"COMMENT '{self.comment}'"))
+
+    def __def__(self) -> _builder.NodeList:
+        return self._defi
 
     def __hash__(self) -> int:
         return hash(self.name)
@@ -1232,8 +1330,9 @@ class Table(_builder.Node):
 
     def __sql__(self, ctx: _builder.Context) -> _builder.Context:
         if ctx.props.get('select') is True:
-            ctx.literal("{} AS {}".format(
-                self.table_name, ctx.table_alias(self.name)))
+            ctx.literal(
+                self.table_name + ' AS ' + ctx.table_alias(self.name)
+            )
         else:
             ctx.literal(self.table_name)
         return ctx
@@ -4,7 +4,6 @@
 """
 from __future__ import annotations
 
-from collections.abc import Iterable
 from functools import wraps, reduce
 from inspect import iscoroutinefunction, isclass, signature
 from typing import Any, Dict, Callable, Type
@@ -279,7 +278,7 @@ def formatadict(original: Any):
     if isinstance(original, dict):
         return do_format(original)
 
-    if isinstance(original, Iterable):
+    if hasattr(original, '__iter__'):
         fmted = []
         for item in original:
             if not isinstance(item, (list, tuple, dict)):
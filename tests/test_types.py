@@ -20,15 +20,19 @@ def test_exprs():
 
     e = (age > 20) & True
     assert _builder.parse(e) == _builder.Query(
-        '((`age` > %s) AND %s);', (20, True)
+        '(`age` > %s);', (20,)
     )
     e = True & (age > 10)
     assert _builder.parse(e) == _builder.Query(
-        '(%s AND (`age` > %s));', (True, 10,)
+        '(`age` > %s);', (10,)
     )
     e = False | (age > 10)
     assert _builder.parse(e) == _builder.Query(
-        '(%s OR (`age` > %s));', (False, 10,)
+        '(`age` > %s);', (10,)
+    )
+    e = (age > 10) & False
+    assert _builder.parse(e) == _builder.Query(
+        '((`age` > %s) AND %s);', (10, False)
     )
     e = (age > 10) | (name == 'test')
     assert _builder.parse(e) == _builder.Query(
@@ -281,6 +285,16 @@ def test_exprs():
     assert _builder.parse(e) == _builder.Query(
         '((`name` = %s) AND (`age` > %s));', ('test', 10)
     )
+    e = (age > 10) & (name == 'test') & (age < 50)
+    assert _builder.parse(e) == _builder.Query(
+        '((`age` > %s) AND (`name` = %s) AND (`age` < %s));',
+        (10, 'test', 50)
+    )
+    e = (age > 10) | (name == 'test') | (age < 50)
+    assert _builder.parse(e) == _builder.Query(
+        '((`age` > %s) OR (`name` = %s) OR (`age` < %s));',
+        (10, 'test', 50)
+    )
     e = (age >= '20') & name.in_(['at7h', 'mejor']) | password.startswith('153')
     assert _builder.parse(e) == _builder.Query(
         '(((`age` >= %s) AND (`name` IN %s)) OR (`password` LIKE %s));',
@@ -786,6 +800,25 @@ def test_funs():
     m_ = t.F.MAX(age).as_('age_max')
     assert _builder.parse(m_).sql == 'MAX(`age`) AS `age_max`;'
 
+    # Parsing a bare Func must not be confused by its permissive
+    # __getattr__ when the cache is probed.
+    c = t.F.COUNT(t.SQL('1'))
+    assert _builder.parse(c) == _builder.Query('COUNT(1);')
+    assert _builder.parse(c) == _builder.Query('COUNT(1);')
+
+    # Nor must building an expression around a Func operand consult
+    # it for a db_value converter: the parameter stays the plain
+    # value and no 'db_value' factory lands in the table.
+    e = t.Expression(c, t.OPERATOR.EQ, 5)
+    assert _builder.parse(e) == _builder.Query('(COUNT(1) = %s);', (5,))
+    assert 'db_value' not in t.Func._factories
+
+    # Mutating a returned query must not poison later parses.
+    e = age > 20
+    q = _builder.parse(e)
+    q.r = True
+    assert _builder.parse(e).r is False
+
 
 class TypesModel(Model):
 